@@ -1,5 +1,6 @@
 """Basic agent class. See https://mini-swe-agent.com/latest/advanced/control_flow/ for visual explanation."""
 
+import functools
 import re
 import subprocess
 import time
@@ -10,6 +11,18 @@ from pydantic import BaseModel
 from minisweagent import Environment, Model
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_action_regex(pattern: str) -> re.Pattern:
+    """Compile the action regex once per pattern (it is queried on every LM response)."""
+    return re.compile(pattern, re.DOTALL)
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_template(template: str) -> Template:
+    """Compile a Jinja template once per source string (templates are rendered on every step)."""
+    return Template(template, undefined=StrictUndefined)
+
+
 class AgentConfig(BaseModel):
     # Check the config files in minisweagent/config for example settings
     system_template: str
@@ -56,9 +69,7 @@ class DefaultAgent:
 
     def render_template(self, template: str, **kwargs) -> str:
         template_vars = self.config.model_dump() | self.env.get_template_vars() | self.model.get_template_vars()
-        return Template(template, undefined=StrictUndefined).render(
-            **kwargs, **template_vars, **self.extra_template_vars
-        )
+        return _compile_template(template).render(**kwargs, **template_vars, **self.extra_template_vars)
 
     def add_message(self, role: str, content: str, **kwargs):
         self.messages.append({"role": role, "content": content, "timestamp": time.time(), **kwargs})
@@ -99,7 +110,7 @@ class DefaultAgent:
 
     def parse_action(self, response: dict) -> dict:
         """Parse the action from the message. Returns the action."""
-        actions = re.findall(self.config.action_regex, response["content"], re.DOTALL)
+        actions = _compile_action_regex(self.config.action_regex).findall(response["content"])
         if len(actions) == 1:
             return {"action": actions[0].strip(), **response}
         raise FormatError(self.render_template(self.config.format_error_template, actions=actions))
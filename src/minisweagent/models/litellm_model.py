@@ -36,6 +36,8 @@ class LitellmModel:
         self.config = config_class(**kwargs)
         self.cost = 0.0
         self.n_calls = 0
+        # Bound once so the per-query path is a plain attribute read instead of a pydantic lookup
+        self._cache_control_mode = self.config.set_cache_control
         if self.config.litellm_model_registry and Path(self.config.litellm_model_registry).is_file():
             litellm.utils.register_model(json.loads(Path(self.config.litellm_model_registry).read_text()))
 
@@ -58,16 +60,15 @@ class LitellmModel:
     )
     def _query(self, messages: list[dict[str, str]], **kwargs):
         try:
-            return litellm.completion(
-                model=self.config.model_name, messages=messages, **(self.config.model_kwargs | kwargs)
-            )
+            completion_kwargs = self.config.model_kwargs | kwargs if kwargs else self.config.model_kwargs
+            return litellm.completion(model=self.config.model_name, messages=messages, **completion_kwargs)
         except litellm.exceptions.AuthenticationError as e:
             e.message += " You can permanently set your API key with `mini-extra config set KEY VALUE`."
             raise e
 
     def query(self, messages: list[dict[str, str]], **kwargs) -> dict:
-        if self.config.set_cache_control:
-            messages = set_cache_control(messages, mode=self.config.set_cache_control)
+        if self._cache_control_mode:
+            messages = set_cache_control(messages, mode=self._cache_control_mode)
         response = self._query([{"role": msg["role"], "content": msg["content"]} for msg in messages], **kwargs)
         try:
             cost = litellm.cost_calculator.completion_cost(response, model=self.config.model_name)
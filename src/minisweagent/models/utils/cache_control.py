@@ -10,6 +10,12 @@ def _get_content_text(entry: dict) -> str:
     return entry["content"][0]["text"]
 
 
+def _has_cache_control(entry: dict) -> bool:
+    if "cache_control" in entry:
+        return True
+    return isinstance(entry["content"], list) and any("cache_control" in part for part in entry["content"])
+
+
 def _clear_cache_control(entry: dict) -> None:
     if isinstance(entry["content"], list):
         assert len(entry["content"]) == 1, "Expected single message in content"
@@ -37,18 +43,27 @@ def _set_cache_control(entry: dict) -> None:
 def set_cache_control(
     messages: list[dict], *, mode: Literal["default_end"] | None = "default_end", last_n_messages_offset: int = 0
 ) -> list[dict]:
-    """This messages processor adds manual cache control marks to the messages."""
+    """This messages processor adds manual cache control marks to the messages.
+
+    Entries are treated as read-only: the returned list only copies the entries
+    whose markers change, all other entries are shared with the input.
+    """
     # ONLY ADD TO THE LAST MESSAGE
     if mode != "default_end":
         raise ValueError(f"Invalid mode: {mode}")
     if last_n_messages_offset:
         warnings.warn("last_n_messages_offset is deprecated and will be removed in the future. It has no effect.")
 
-    messages = copy.deepcopy(messages)
+    # Only the last message carries a marker, so instead of deep-copying the whole
+    # (growing) conversation on every call, copy just the new tail and any previously
+    # marked entry. This keeps the per-call cost constant for typical agent loops.
     new_messages = []
-    for i_entry, entry in enumerate(reversed(messages)):
-        _clear_cache_control(entry)
-        if i_entry == 0:
-            _set_cache_control(entry)
+    for i_entry, entry in enumerate(messages):
+        is_last = i_entry == len(messages) - 1
+        if is_last or _has_cache_control(entry):
+            entry = copy.deepcopy(entry)
+            _clear_cache_control(entry)
+            if is_last:
+                _set_cache_control(entry)
         new_messages.append(entry)
-    return list(reversed(new_messages))
+    return new_messages
@@ -4,11 +4,10 @@ from pathlib import Path
 
 import requests
 import typer
-import yaml
 from rich.console import Console
 
 from minisweagent.agents.interactive import InteractiveAgent
-from minisweagent.config import builtin_config_dir, get_config_path
+from minisweagent.config import builtin_config_dir, get_config_path, load_config_file
 from minisweagent.environments.docker import DockerEnvironment
 from minisweagent.models import get_model
 from minisweagent.run.extra.config import configure_if_first_time
@@ -52,7 +51,7 @@ def main(
 
     config_path = get_config_path(config)
     console.print(f"Loading agent config from [bold green]'{config_path}'[/bold green]")
-    _config = yaml.safe_load(config_path.read_text())
+    _config = load_config_file(config_path)
     _agent_config = _config.setdefault("agent", {})
     if yolo:
         _agent_config["mode"] = "yolo"
@@ -13,14 +13,12 @@ import traceback
 from pathlib import Path
 
 import typer
-import yaml
-from datasets import load_dataset
 from jinja2 import StrictUndefined, Template
 from rich.live import Live
 
 from minisweagent import Environment
 from minisweagent.agents.default import DefaultAgent
-from minisweagent.config import builtin_config_dir, get_config_path
+from minisweagent.config import builtin_config_dir, get_config_path, load_config_file
 from minisweagent.environments import get_environment
 from minisweagent.models import get_model
 from minisweagent.run.extra.utils.batch_progress import RunBatchProgressManager
@@ -208,6 +206,9 @@ def main(
     environment_class: str | None = typer.Option( None, "--environment-class", help="Environment type to use. Recommended are docker or singularity", rich_help_panel="Advanced"),
 ) -> None:
     # fmt: on
+    # Lazy import keeps --help and tab completion fast (datasets drags in pyarrow & friends)
+    from datasets import load_dataset
+
     output_path = Path(output)
     output_path.mkdir(parents=True, exist_ok=True)
     logger.info(f"Results will be saved to {output_path}")
@@ -226,7 +227,7 @@ def main(
 
     config_path = get_config_path(config_spec)
     logger.info(f"Loading agent config from '{config_path}'")
-    config = yaml.safe_load(config_path.read_text())
+    config = load_config_file(config_path)
     if environment_class is not None:
         config.setdefault("environment", {})["environment_class"] = environment_class
     if model is not None:
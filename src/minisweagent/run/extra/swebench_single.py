@@ -1,15 +1,16 @@
-"""Run on a single SWE-Bench instance."""
+"""Run on a single SWE-Bench instance.
+
+To run on many instances concurrently, use `minisweagent.run.extra.swebench`
+(`mini-extra swebench --workers N`) instead of scripting this command in a loop.
+"""
 
 import traceback
 from pathlib import Path
 
 import typer
-import yaml
-from datasets import load_dataset
 
 from minisweagent import global_config_dir
-from minisweagent.agents.interactive import InteractiveAgent
-from minisweagent.config import builtin_config_dir, get_config_path
+from minisweagent.config import builtin_config_dir, get_config_path, load_config_file
 from minisweagent.models import get_model
 from minisweagent.run.extra.swebench import (
     DATASET_MAPPING,
@@ -38,19 +39,27 @@ def main(
 ) -> None:
     # fmt: on
     """Run on a single SWE-Bench instance."""
+    # Lazy imports keep --help and tab completion fast (datasets drags in pyarrow & friends)
+    import pyarrow.compute as pc
+    from datasets import load_dataset
+
+    from minisweagent.agents.interactive import InteractiveAgent
+
     dataset_path = DATASET_MAPPING.get(subset, subset)
     logger.info(f"Loading dataset from {dataset_path}, split {split}...")
-    instances = {
-        inst["instance_id"]: inst  # type: ignore
-        for inst in load_dataset(dataset_path, split=split)
-    }
+    dataset = load_dataset(dataset_path, split=split)
+    # Resolve the spec against the Arrow column directly so the scan stays in
+    # vectorized kernels and the column is never materialized into Python.
+    instance_ids = dataset.data.column("instance_id")
     if instance_spec.isnumeric():
-        instance_spec = sorted(instances.keys())[int(instance_spec)]
-    instance: dict = instances[instance_spec]  # type: ignore
+        row_idx = pc.sort_indices(instance_ids)[int(instance_spec)].as_py()
+    elif (row_idx := pc.index(instance_ids, instance_spec).as_py()) < 0:
+        raise ValueError(f"Instance ID '{instance_spec}' not found in {dataset_path} ({split} split)")
+    instance: dict = dataset[row_idx]
 
     config_path = get_config_path(config_path)
     logger.info(f"Loading agent config from '{config_path}'")
-    config = yaml.safe_load(config_path.read_text())
+    config = load_config_file(config_path)
     if environment_class is not None:
         config.setdefault("environment", {})["environment_class"] = environment_class
     if model_class is not None:
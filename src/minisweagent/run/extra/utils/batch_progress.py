@@ -149,7 +149,8 @@ class RunBatchProgressManager:
                 self._task_progress_bar.remove_task(self._spinner_tasks[instance_id])
             except KeyError:
                 pass
-            self._main_progress_bar.update(TaskID(0), advance=1, eta=self._get_eta_text())
+            # eta is refreshed by _update_total_costs below, no need to compute it twice
+            self._main_progress_bar.update(TaskID(0), advance=1)
         self.update_exit_status_table()
         self._update_total_costs()
         if self._yaml_report_path is not None:
@@ -1,11 +1,10 @@
 import os
-from pathlib import Path
 
 import typer
-import yaml
 
 from minisweagent import package_dir
 from minisweagent.agents.default import DefaultAgent
+from minisweagent.config import load_config_file
 from minisweagent.environments.local import LocalEnvironment
 from minisweagent.models.litellm_model import LitellmModel
 
@@ -26,7 +25,7 @@ def main(
     agent = DefaultAgent(
         LitellmModel(model_name=model_name),
         LocalEnvironment(),
-        **yaml.safe_load(Path(package_dir / "config" / "default.yaml").read_text())["agent"],
+        **load_config_file(package_dir / "config" / "default.yaml")["agent"],
     )
     agent.run(task)
     return agent
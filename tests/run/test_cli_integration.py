@@ -22,7 +22,7 @@ def test_configure_if_first_time_called():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -62,7 +62,7 @@ def test_mini_command_calls_run_interactive():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -107,7 +107,7 @@ def test_mini_v_command_calls_run_textual():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -153,7 +153,7 @@ def test_mini_calls_prompt_when_no_task_provided():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_prompt.return_value = "User provided task"
@@ -200,7 +200,7 @@ def test_mini_v_calls_prompt_when_no_task_provided():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_prompt.return_value = "User provided visual task"
@@ -246,7 +246,7 @@ def test_mini_with_explicit_model():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -295,7 +295,7 @@ def test_yolo_mode_sets_correct_agent_config():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -340,7 +340,7 @@ def test_confirm_mode_sets_correct_agent_config():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -540,7 +540,7 @@ def test_exit_immediately_flag_sets_confirm_exit_false():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -582,7 +582,7 @@ def test_no_exit_immediately_flag_sets_confirm_exit_true():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
     ):
         # Setup mocks
         mock_model = Mock()
@@ -625,7 +625,7 @@ def test_exit_immediately_flag_with_typer_runner():
         patch("minisweagent.run.mini.get_model") as mock_get_model,
         patch("minisweagent.run.mini.LocalEnvironment") as mock_env,
         patch("minisweagent.run.mini.get_config_path") as mock_get_config_path,
-        patch("minisweagent.run.mini.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.mini.load_config_file") as mock_yaml_load,
         patch("minisweagent.run.mini.save_traj"),
     ):
         # Setup mocks
@@ -52,7 +52,7 @@ def test_configure_if_first_time_called():
         patch("minisweagent.run.extra.github_issue.InteractiveAgent") as mock_agent,
         patch("minisweagent.run.extra.github_issue.get_model"),
         patch("minisweagent.run.extra.github_issue.DockerEnvironment"),
-        patch("minisweagent.run.extra.github_issue.yaml.safe_load") as mock_yaml_load,
+        patch("minisweagent.run.extra.github_issue.load_config_file") as mock_yaml_load,
         patch("minisweagent.run.extra.github_issue.get_config_path") as mock_get_config_path,
         patch("minisweagent.run.extra.github_issue.save_traj"),
     ):